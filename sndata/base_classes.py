@@ -9,7 +9,10 @@ docs.
 """
 
 import abc
+import os
 import shutil
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import List
 from typing import Union, Tuple
@@ -176,18 +179,26 @@ class SpectroscopicRelease(Base, metaclass=abc.ABCMeta):
             self,
             verbose: bool = False,
             format_table: bool = True,
-            filter_func: bool = None) -> Table:
+            filter_func: bool = None,
+            max_workers: int = 1,
+            max_prefetch: int = 0) -> Table:
         """Iterate through all available targets and yield data tables
 
         An optional progress bar can be formatted by passing a dictionary of
         ``tqdm`` arguments. Outputs can be optionally filtered by passing a
         function ``filter_func`` that accepts a data table and returns a
-        boolean.
+        boolean. Data for multiple targets can be loaded in parallel by
+        setting ``max_workers`` to a value greater than one. Otherwise, data
+        for up to ``max_prefetch`` targets can be loaded in a background
+        thread ahead of the target currently being yielded. Warnings issued
+        while loading prefetched data are not suppressed.
 
         Args:
             verbose: Optionally display progress bar while iterating
             format_table: Format data for ``SNCosmo`` (Default: True)
             filter_func: An optional function to filter outputs by
+            max_workers: Number of processes used to load data (Default: 1)
+            max_prefetch: Number of targets to load in advance (Default: 0)
 
         Yields:
             Astropy tables
@@ -197,14 +208,49 @@ class SpectroscopicRelease(Base, metaclass=abc.ABCMeta):
         if filter_func is None:
             filter_func = lambda x: x
 
-        iterable = wrappers.build_pbar(self.get_available_ids(), verbose)
-        for obj_id in iterable:
-            data_table = self.get_data_for_id(
-                obj_id, format_table=format_table)
+        # Tables are yielded in the same order as ``get_available_ids``
+        obj_ids = self.get_available_ids()
+        get_data = partial(self.get_data_for_id, format_table=format_table)
+        if max_workers > 1:
+            data_tables = self._iter_data_parallel(get_data, obj_ids, max_workers)
 
+        elif max_prefetch > 0:
+            # ``warnings.catch_warnings`` is not thread safe, so the
+            # background thread bypasses ``ignore_warnings_wrapper``.
+            # Ids are already known to be valid.
+            get_data = partial(self._get_data_for_id, format_table=format_table)
+            data_tables = wrappers.prefetch_map(get_data, obj_ids, max_prefetch)
+
+        else:
+            data_tables = map(get_data, obj_ids)
+
+        for data_table in wrappers.build_pbar(data_tables, verbose, len(obj_ids)):
             if filter_func(data_table):
                 yield data_table
 
+    @staticmethod
+    def _iter_data_parallel(get_data: callable, obj_ids: List[str], max_workers: int) -> Table:
+        """Load data for multiple targets in parallel processes
+
+        Args:
+            get_data: Function returning the data table for a given object Id
+            obj_ids: The object Ids to load data for
+            max_workers: Number of processes used to load data
+
+        Yields:
+            Astropy tables in the same order as ``obj_ids``
+        """
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            data_tables = executor.map(get_data, obj_ids)
+            try:
+                yield from data_tables
+
+            finally:
+                # Cancel pending work (e.g., if iteration stops early) before
+                # the executor waits for running work to finish
+                data_tables.close()
+
     def delete_module_data(self) -> None:
         """Delete any data for the current survey / data release"""
 
@@ -214,6 +260,10 @@ class SpectroscopicRelease(Base, metaclass=abc.ABCMeta):
         except FileNotFoundError:
             pass
 
+        # Drop any tables cached from the deleted files
+        self.load_table.cache_clear()
+        data_parsing.parse_vizier_table_descriptions.cache_clear()
+
     def download_module_data(self, force: bool = False, timeout: float = 15):
         """Download data for the current survey / data release
 
@@ -282,14 +332,15 @@ class DefaultParser:
     _filter_file_names: Tuple[str]
     band_names: Tuple[str]
 
+    @wrappers.dir_mtime_cache('_table_dir')
     def _get_available_tables(self) -> List[VizierTableId]:
         """Default backend functionality of ``get_available_tables`` function"""
 
         # Find available tables - assume standard Vizier naming scheme
         # This includes assuming lowercase file names
         table_nums = []
-        for f in self._table_dir.rglob('table*.dat'):
-            table_number = f.stem.lstrip('table')
+        for path in data_parsing.iter_files(self._table_dir, 'table', '.dat', max_depth=0):
+            table_number = os.path.basename(path)[len('table'):-len('.dat')]
             try:
                 table_number = int(table_number)
 
@@ -306,8 +357,11 @@ class DefaultParser:
         readme_path = self._table_dir / 'ReadMe'
         table_path = self._table_dir / f'table{table_id}.dat'
 
-        # Read data from file and add meta data from the readme
-        data = ascii.read(str(table_path), format='cds', readme=str(readme_path))
+        # Read data from file and add meta data from the readme.
+        # The format is known, so skip format guessing.
+        data = ascii.read(
+            str(table_path), format='cds', readme=str(readme_path), guess=False)
+
         description = data_parsing.parse_vizier_table_descriptions(readme_path)[table_id]
         data.meta['description'] = description
         return data
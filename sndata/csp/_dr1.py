@@ -3,68 +3,478 @@
 
 """This module defines the CSP DR1 API"""
 
+import mmap
+import os
+import re
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Tuple, Union
 
-from astropy.table import Table, vstack
+import numpy as np
+from astropy.table import Table
 
 from ..base_classes import DefaultParser, SpectroscopicRelease
-from ..utils import downloads
+from ..utils import data_parsing, downloads, wrappers
 
+try:
+    from numba import njit
 
-def read_csp_spectroscopy_file(path: str, format_table: bool = False) -> Table:
-    """Read a file path of spectroscopic data from CSP
+except ImportError:
+    njit = None
+
+# Matches the numerical value in a file comment (e.g., ``# Epoch: -2.3``)
+_number_regex = re.compile(r'[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?')
+
+# Matches the stem of a spectrum file name (e.g., ``SN04dt_040826_b01_DUP_WF``)
+_file_name_regex = re.compile(
+    r'SN(?P<obj_id>[^_]+)_(?P<date>\d+)_(?P<w_range>[^_]+)'
+    r'_(?P<telescope>[^_]+)_(?P<instrument>[^_]+)')
+
+# Minimum file size in bytes for reading files via a memory map
+_mmap_threshold = 4096
+
+# Numerical columns of returned tables. The schema is fixed for all files,
+# except for the widths of string columns added when formatting tables.
+_formatted_dtype = [('time', 'f8'), ('wavelength', 'f8'), ('flux', 'f8'), ('epoch', 'f8')]
+_unformatted_dtype = [('wavelength', 'f8'), ('flux', 'f8'), ('time', 'f8')]
+
+# Powers of ten that are exactly representable as 64 bit floats
+_exact_powers_of_ten = np.array([float(f'1e{i}') for i in range(23)])
+
+
+@contextmanager
+def _open_files(paths: List[Path]) -> Iterator[List[Union[bytes, mmap.mmap]]]:
+    """Context manager for accessing the raw contents of multiple files
+
+    Files of at least ``_mmap_threshold`` bytes are memory mapped so their
+    contents can be parsed without being copied. Smaller files, where the
+    cost of creating a memory map dominates, are read in full using an
+    unbuffered file object. Memory maps are closed on exit.
 
     Args:
-        path: Path of file to read
+        paths: Paths of the files to read
+
+    Yields:
+        The contents of each file
+    """
+
+    with ExitStack() as stack:
+        contents = []
+        for path in paths:
+            with open(path, 'rb', buffering=0) as ofile:
+                if os.fstat(ofile.fileno()).st_size < _mmap_threshold:
+                    contents.append(ofile.readall())
+
+                else:
+                    memory_map = mmap.mmap(ofile.fileno(), 0, access=mmap.ACCESS_READ)
+                    contents.append(stack.enter_context(memory_map))
+
+        yield contents
+
+
+def _compile(func: callable) -> callable:
+    """Compile a function with ``numba`` if it is installed
+
+    Parsing spectra one character at a time is only practical when compiled.
+    """
+
+    return func if njit is None else njit(cache=True)(func)
+
+
+@_compile
+def _is_digit(char: int) -> bool:
+    """Return whether an ascii character code is a decimal digit"""
+
+    return 48 <= char <= 57
+
+
+@_compile
+def _is_blank(char: int) -> bool:
+    """Return whether an ascii character code is a space, tab, or carriage return"""
+
+    return char == 32 or char == 9 or char == 13
+
+
+@_compile
+def _is_delimiter(buffer: np.ndarray, i: int) -> bool:
+    """Return whether a number can end before the given index
+
+    Args:
+        buffer: Array of ascii character codes
+        i: Index of the character after the number
+    """
+
+    return i >= len(buffer) or buffer[i] == 32 or 9 <= buffer[i] <= 13
+
+
+@_compile
+def _skip_blank(buffer: np.ndarray, i: int) -> int:
+    """Return the index of the next character that is not blank
+
+    Args:
+        buffer: Array of ascii character codes
+        i: Index to start searching from
+    """
+
+    while i < len(buffer) and _is_blank(buffer[i]):
+        i += 1
+
+    return i
+
+
+@_compile
+def _skip_line(buffer: np.ndarray, i: int) -> int:
+    """Return the index of the first character on the next line
+
+    Args:
+        buffer: Array of ascii character codes
+        i: Index to start searching from
+    """
+
+    while i < len(buffer) and buffer[i] != 10:
+        i += 1
+
+    return i + 1
+
+
+@_compile
+def _scan_sign(buffer: np.ndarray, i: int) -> Tuple[float, int]:
+    """Scan an optional ``+`` or ``-`` character
+
+    Args:
+        buffer: Array of ascii character codes
+        i: Index of the possible sign character
+
+    Returns:
+        The sign as ``1.0`` or ``-1.0``
+        The index after the sign character
+    """
+
+    if i < len(buffer) and (buffer[i] == 43 or buffer[i] == 45):  # '+' or '-'
+        return (-1.0 if buffer[i] == 45 else 1.0), i + 1
+
+    return 1.0, i
+
+
+@_compile
+def _scan_digits(buffer: np.ndarray, i: int, mantissa: int) -> Tuple[int, int, int]:
+    """Append consecutive decimal digits to an integer
+
+    Args:
+        buffer: Array of ascii character codes
+        i: Index of the first possible digit
+        mantissa: Integer to append digits to
+
+    Returns:
+        The updated integer
+        The number of scanned digits
+        The index after the last digit
+    """
+
+    start = i
+    while i < len(buffer) and _is_digit(buffer[i]):
+        mantissa = mantissa * 10 + (buffer[i] - 48)
+        i += 1
+
+    return mantissa, i - start, i
+
+
+@_compile
+def _scan_exponent(buffer: np.ndarray, i: int) -> Tuple[int, int]:
+    """Scan an optional exponent (e.g., ``e-15``)
+
+    Args:
+        buffer: Array of ascii character codes
+        i: Index of the possible ``e`` or ``E`` character
+
+    Returns:
+        The value of the exponent
+        The index after the exponent, or -1 if it has no or over three digits
+    """
+
+    if i >= len(buffer) or (buffer[i] != 69 and buffer[i] != 101):
+        return 0, i
+
+    sign, i = _scan_sign(buffer, i + 1)
+    exponent, num_digits, i = _scan_digits(buffer, i, 0)
+    if num_digits == 0 or num_digits > 3:
+        return 0, -1
+
+    return int(sign) * exponent, i
+
+
+@_compile
+def _scale(mantissa: int, exponent: int) -> float:
+    """Return ``mantissa * 10 ** exponent`` using an exact power of ten
+
+    Args:
+        mantissa: Integer mantissa
+        exponent: Decimal exponent with a magnitude of up to 22
+
+    Returns:
+        The scaled value
+    """
+
+    value = float(mantissa)
+    if exponent < 0:
+        return value / _exact_powers_of_ten[-exponent]
+
+    return value * _exact_powers_of_ten[exponent]
+
+
+@_compile
+def _parse_float(buffer: np.ndarray, i: int) -> Tuple[float, int]:
+    """Parse a decimal number from an array of ascii character codes
+
+    Args:
+        buffer: Array of ascii character codes
+        i: Index of the first character of the number
+
+    Returns:
+        The parsed value
+        The index after the last character, or -1 if not parsed exactly
+    """
+
+    # Accumulate digits as an integer while tracking the decimal exponent
+    sign, i = _scan_sign(buffer, i)
+    mantissa, num_digits, i = _scan_digits(buffer, i, 0)
+    num_fraction_digits = 0
+    if i < len(buffer) and buffer[i] == 46:  # '.'
+        mantissa, num_fraction_digits, i = _scan_digits(buffer, i + 1, mantissa)
+
+    num_digits += num_fraction_digits
+    exponent, i = _scan_exponent(buffer, i)
+    if num_digits == 0 or i < 0 or not _is_delimiter(buffer, i):
+        return 0.0, -1
+
+    # Scaling by an exact power of ten is only correctly rounded for
+    # mantissas below 2 ** 53 and exponents with a magnitude of up to 22.
+    # Anything else is left for a general purpose parser.
+    exponent -= num_fraction_digits
+    if num_digits > 15 or not -22 <= exponent <= 22:
+        return 0.0, -1
+
+    return sign * _scale(mantissa, exponent), i
+
+
+@_compile
+def _parse_row(buffer: np.ndarray, i: int, out: np.ndarray, row: int) -> int:
+    """Parse the first two values on a line of white space delimited data
+
+    Args:
+        buffer: Array of ascii character codes
+        i: Index of the first value on the line
+        out: Array with shape (N, 2) to write parsed values into
+        row: Index of the row in ``out`` to write values into
+
+    Returns:
+        The index after the second value, or -1 if not parsed exactly
+    """
+
+    if row >= len(out):
+        return -1
+
+    for column in range(2):
+        value, i = _parse_float(buffer, _skip_blank(buffer, i))
+        if i < 0:
+            return -1
+
+        out[row, column] = value
+
+    return i
+
+
+@_compile
+def _parse_columns(buffer: np.ndarray, out: np.ndarray) -> int:
+    """Parse the first two columns of white space delimited numerical data
+
+    Lines starting with ``#`` and empty lines are skipped. Any columns after
+    the first two are ignored. Parsing stops if any value cannot be parsed
+    exactly (e.g., ``nan`` or values with more than 15 significant digits).
+
+    Args:
+        buffer: Array of ascii character codes to parse
+        out: Array with shape (N, 2) to write parsed values into
+
+    Returns:
+        The number of parsed rows, or -1 if parsing was stopped
+    """
+
+    num_rows, i = 0, _skip_blank(buffer, 0)
+    while i < len(buffer):
+        if buffer[i] != 10 and buffer[i] != 35:  # Not empty or ``#``
+            i = _parse_row(buffer, i, out, num_rows)
+            if i < 0:
+                return -1
+
+            num_rows += 1
+
+        i = _skip_blank(buffer, _skip_line(buffer, i))
+
+    return num_rows
+
+
+def _parse_spectrum(
+        contents: Union[bytes, mmap.mmap]) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+    """Parse the wavelength and flux values from a CSP spectrum file
+
+    Spectra are parsed directly instead of using the generic astropy ascii
+    reader. If ``numba`` is installed, values are parsed using a compiled
+    parser. Any columns after the first two are ignored.
+
+    Args:
+        contents: The raw contents of the file
+
+    Returns:
+        An array of wavelength values
+        An array of flux values
+        A list of file comments
+    """
+
+    # Comments are only included in the file header
+    comments, start = [], 0
+    while contents[start:start + 1] == b'#':
+        end = contents.find(b'\n', start)
+        end = len(contents) if end < 0 else end
+        comments.append(contents[start + 1:end].decode().strip())
+        start = end + 1
+
+    if njit is not None:
+        buffer = np.frombuffer(contents, dtype=np.uint8)
+        try:
+            out = np.empty((np.count_nonzero(buffer == 10) + 1, 2))
+            num_rows = _parse_columns(buffer, out)
+
+        finally:
+            # Release the buffer so memory mapped files can be closed
+            del buffer
+
+        if num_rows >= 0:
+            return out[:num_rows, 0], out[:num_rows, 1], comments
+
+    # Fall back to numpy for values not handled by the compiled parser
+    lines = contents[start:].decode().splitlines()
+    data_lines = [line for line in lines if line.strip() and not line.startswith('#')]
+    wavelength, flux = np.loadtxt(data_lines, usecols=(0, 1), ndmin=2, unpack=True)
+    return wavelength, flux, comments
+
+
+def _parse_file_comments(comments: List[str]) -> Tuple[float, float, float]:
+    """Parse meta data from the comments of a CSP spectrum file
+
+    Args:
+        comments: Comments from the header of the file
+
+    Returns:
+        The redshift of the target
+        The JD of the observation
+        The epoch of the spectrum
+    """
+
+    # Comments are ordered as: object name, redshift, date of maximum,
+    # date of observation, epoch
+    redshift, _, obs_date, epoch = (
+        float(_number_regex.search(comments[i]).group()) for i in (1, 2, 3, 4))
+
+    return redshift, obs_date, epoch
+
+
+def _parse_file_name(path: Path) -> Tuple[str, str, str, str]:
+    """Parse meta data from the name of a CSP spectrum file
+
+    Args:
+        path: Path of the file
+
+    Returns:
+        The object Id of the target
+        The wavelength range of the spectrum
+        The telescope used for the observation
+        The instrument used for the observation
+    """
+
+    match = _file_name_regex.fullmatch(path.stem)
+    if match is None:
+        raise ValueError(f'Unexpected file name for CSP spectrum: {path.name}')
+
+    return '20' + match['obj_id'], match['w_range'], match['telescope'], match['instrument']
+
+
+def _stack_spectra(
+        paths: List[Path],
+        contents: List[Union[bytes, mmap.mmap]],
+        format_table: bool) -> Table:
+    """Build a single table of data from one or more CSP spectrum files
+
+    Data from all files is written into a single preallocated structured
+    array instead of building and stacking a table for each file.
+
+    Args:
+        paths: Paths of the files
+        contents: The raw contents of each file
         format_table: Format table to a sndata standard format
 
     Returns:
         An astropy table with file data and meta data
     """
 
-    path = Path(path)
-    obj_id = '20' + path.name.split('_')[0].lstrip('SN')
+    # One file (SN07bc_070409_b01_BAA_IM) has three columns instead of two.
+    # Only the first two columns are read, so it needs no special handling.
+    spectra = [_parse_spectrum(file_contents) for file_contents in contents]
+    redshift, obs_date, epoch = zip(*(_parse_file_comments(s[2]) for s in spectra))
 
-    # Handle the single file with a different data model:
-    # This file has three columns instead of two
-    if path.stem == 'SN07bc_070409_b01_BAA_IM':
-        data = Table.read(path, format='ascii', names=['wavelength', 'flux', '_'])
-        data.remove_column('_')
+    # Values in the file name are constant for a single file
+    # (i.e. a single spectrum) but vary across files (across spectra)
+    file_meta = [_parse_file_name(path) for path in paths]
+    _, w_range, telescope, instrument = (np.array(values) for values in zip(*file_meta))
 
-    else:
-        data = Table.read(path, format='ascii', names=['wavelength', 'flux'])
+    if format_table:
+        dtype = _formatted_dtype + [
+            ('wavelength_range', w_range.dtype),
+            ('telescope', telescope.dtype),
+            ('instrument', instrument.dtype)
+        ]
 
-    # Read the table meta data
-    file_comments = data.meta['comments']
-    redshift = float(file_comments[1].lstrip('Redshift: '))
-    obs_date = float(file_comments[3].lstrip('JDate_of_observation: '))
-    epoch = float(file_comments[4].lstrip('Epoch: '))
+    else:
+        dtype = _unformatted_dtype
+
+    # Fill each column for all files at once instead of slicing per file
+    lengths = [len(spectrum[0]) for spectrum in spectra]
+    data = np.empty(sum(lengths), dtype=dtype)
+    np.concatenate([spectrum[0] for spectrum in spectra], out=data['wavelength'])
+    np.concatenate([spectrum[1] for spectrum in spectra], out=data['flux'])
+    data['time'] = np.repeat(obs_date, lengths)
+    if format_table:
+        data['epoch'] = np.repeat(epoch, lengths)
+        data['wavelength_range'] = np.repeat(w_range, lengths)
+        data['telescope'] = np.repeat(telescope, lengths)
+        data['instrument'] = np.repeat(instrument, lengths)
 
     # Add meta data to output table according to sndata standard
-    data.meta['obj_id'] = obj_id
-    data.meta['ra'] = None
-    data.meta['dec'] = None
-    data.meta['z'] = redshift
-    data.meta['z_err'] = None
-    del data.meta['comments']
-
-    data['time'] = obs_date
-    if format_table:
-        # Add remaining columns. These values are constant for a single file
-        # (i.e. a single spectrum) but vary across files (across spectra)
-        _, _, w_range, telescope, instrument = path.stem.split('_')
-        data['epoch'] = epoch
-        data['wavelength_range'] = w_range
-        data['telescope'] = telescope
-        data['instrument'] = instrument
+    meta = {
+        'obj_id': file_meta[0][0],
+        'ra': None,
+        'dec': None,
+        'z': redshift[0],
+        'z_err': None
+    }
+
+    return Table(data, meta=meta, copy=False)
+
 
-        # Enforce an intuitive column order
-        data = data[[
-            'time', 'wavelength', 'flux', 'epoch',
-            'wavelength_range', 'telescope', 'instrument']]
+def read_csp_spectroscopy_file(path: str, format_table: bool = False) -> Table:
+    """Read a file path of spectroscopic data from CSP
+
+    Args:
+        path: Path of file to read
+        format_table: Format table to a sndata standard format
+
+    Returns:
+        An astropy table with file data and meta data
+    """
 
-    return data
+    paths = [Path(path)]
+    with _open_files(paths) as contents:
+        return _stack_spectra(paths, contents, format_table)
 
 
 class DR1(DefaultParser, SpectroscopicRelease):
@@ -106,12 +516,13 @@ class DR1(DefaultParser, SpectroscopicRelease):
         self._spectra_url = 'https://csp.obs.carnegiescience.edu/data/CSP_spectra_DR1.tgz'
         self._table_url = 'http://cdsarc.u-strasbg.fr/viz-bin/nph-Cat/tar.gz?J/ApJ/773/53'
 
+    @wrappers.dir_mtime_cache('_spectra_dir')
     def _get_available_ids(self) -> List[str]:
         """Return a list of target object IDs for the current survey"""
 
-        files = self._spectra_dir.glob('SN*.dat')
-        ids = ('20' + Path(f).name.split('_')[0].lstrip('SN') for f in files)
-        return sorted(set(ids))
+        # File names start with the object Id, e.g., SN04dt_040826_b01_DUP_WF.dat
+        files = data_parsing.iter_files(self._spectra_dir, 'SN', '.dat', max_depth=0)
+        return sorted({'20' + os.path.basename(f)[2:].split('_', 1)[0] for f in files})
 
     def _get_data_for_id(self, obj_id: str, format_table: bool = True) -> Table:
         """Returns data for a given object ID
@@ -124,11 +535,14 @@ class DR1(DefaultParser, SpectroscopicRelease):
             An astropy table of data for the given ID
         """
 
-        files = self._spectra_dir.rglob(f'SN{obj_id[2:]}_*.dat')
-        if not files:
+        prefix = f'SN{obj_id[2:]}_'
+        files = data_parsing.iter_files(self._spectra_dir, prefix, '.dat', max_depth=0)
+        paths = [Path(f) for f in files]
+        if not paths:
             raise ValueError(f'No data found for obj_id {obj_id}')
 
-        return vstack([read_csp_spectroscopy_file(path, format_table) for path in files])
+        with _open_files(paths) as contents:
+            return _stack_spectra(paths, contents, format_table)
 
     def _download_module_data(self, force: bool = False, timeout: float = 15):
         """Download data for the current survey / data release
@@ -13,6 +13,7 @@ from typing import Union
 import numpy as np
 import sncosmo
 
+from . import wrappers
 from ..exceptions import NoDownloadedData
 
 
@@ -56,9 +57,45 @@ def find_data_dir(survey_abbrev: str, release: str) -> Path:
     return data_dir
 
 
+def iter_files(
+        directory: Union[Path, str],
+        prefix: str = '',
+        suffix: str = '',
+        max_depth: int = 1):
+    """Iterate over files in a directory with a given prefix and suffix
+
+    Directories are walked using ``os.scandir``, which avoids creating
+    ``Path`` objects for every directory entry. Nothing is yielded if the
+    directory does not exist.
+
+    Args:
+        directory: The directory to search
+        prefix: Only yield files with names starting with this string
+        suffix: Only yield files with names ending with this string
+        max_depth: Maximum number of subdirectory levels to search (Default: 1)
+
+    Yields:
+        The path of each matching file as a string
+    """
+
+    if not os.path.isdir(directory):
+        return
+
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir() and max_depth > 0:
+                yield from iter_files(entry.path, prefix, suffix, max_depth - 1)
+
+            elif entry.is_file() and entry.name.startswith(prefix) and entry.name.endswith(suffix):
+                yield entry.path
+
+
+@wrappers.lru_copy_cache()
 def parse_vizier_table_descriptions(readme_path: Union[Path, str]):
     """Returns the table descriptions from a vizier readme file
 
+    Returns are cached for each file path.
+
     Args:
         readme_path: Path of the file to read
 
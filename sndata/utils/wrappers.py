@@ -6,8 +6,11 @@ parent package.
 """
 
 import functools
+import os
 import warnings
-from copy import deepcopy
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy as shallow_copy, deepcopy
 from typing import Union
 
 from tqdm import tqdm
@@ -52,12 +55,89 @@ def lru_copy_cache(maxsize: int = 128, typed: bool = False, copy: bool = True):
         def wrapper(*args, **kwargs):
             return deepcopy(cached_func(*args, **kwargs))
 
+        # Expose the same cache management hooks as ``functools.lru_cache``
+        wrapper.cache_info = cached_func.cache_info
+        wrapper.cache_clear = cached_func.cache_clear
         return wrapper
 
     return decorator
 
 
-def build_pbar(data: iter, verbose: Union[bool, dict]):
+def dir_mtime_cache(dir_attr: str):
+    """Decorator to cache the return of a method until a directory is modified
+
+    The cache is keyed on the path and modification time of the directory
+    stored under the ``dir_attr`` attribute of the instance, so adding or
+    removing files invalidates the cached value. The decorated method should
+    not take any arguments other than ``self``. A shallow copy of the cached
+    value is returned. If the directory does not exist, the return of the
+    method is not cached.
+
+    Args:
+        dir_attr: Name of the instance attribute storing the directory path
+
+    Returns:
+        A decorator
+    """
+
+    # noinspection PyMissingOrEmptyDocstring
+    def decorator(f):
+        cache = dict()
+
+        @functools.wraps(f)
+        def wrapper(self):
+            directory = str(getattr(self, dir_attr))
+            try:
+                mtime = os.stat(directory).st_mtime_ns
+
+            except FileNotFoundError:
+                return f(self)
+
+            cached_mtime, value = cache.get(directory, (None, None))
+            if cached_mtime != mtime:
+                value = f(self)
+                cache[directory] = (mtime, value)
+
+            return shallow_copy(value)
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
+
+
+def prefetch_map(func: callable, data: iter, max_prefetch: int = 2):
+    """Lazily map a function over an iterable using a background thread
+
+    Up to ``max_prefetch`` values are evaluated ahead of the consumer so that
+    IO in ``func`` overlaps with any processing of the previous returns.
+    Values are yielded in the same order as ``data``.
+
+    Args:
+        func: The function to map
+        data: An iterable of arguments for ``func``
+        max_prefetch: Maximum number of values to evaluate in advance
+
+    Yields:
+        The return of ``func`` for each element in ``data``
+    """
+
+    if max_prefetch < 1:
+        yield from map(func, data)
+        return
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = deque()
+        for item in data:
+            pending.append(executor.submit(func, item))
+            if len(pending) > max_prefetch:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+
+
+def build_pbar(data: iter, verbose: Union[bool, dict], total: int = None):
     """Cast an iterable into a progress bar
 
     If verbose is False, return ``data`` unchanged.
@@ -65,13 +145,14 @@ def build_pbar(data: iter, verbose: Union[bool, dict]):
     Args:
         data: An iterable object
         verbose: Arguments for tqdm.tqdm
+        total: Number of expected iterations if ``data`` has no length
     """
 
     if isinstance(verbose, dict):
-        iter_data = tqdm(data, **verbose)
+        iter_data = tqdm(data, **{'total': total, **verbose})
 
     elif verbose:
-        iter_data = tqdm(data)
+        iter_data = tqdm(data, total=total)
 
     else:
         iter_data = data
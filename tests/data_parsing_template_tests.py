@@ -71,10 +71,7 @@ class SpectroscopicDataParsing:
         """Test ``get_available_ids`` returns sorted ids"""
 
         obj_ids = self.test_class.get_available_ids()
-        is_sorted = all(
-            obj_ids[i] <= obj_ids[i + 1] for i in range(len(obj_ids) - 1))
-
-        self.assertTrue(is_sorted)
+        self.assertListEqual(sorted(obj_ids), list(obj_ids))
 
     def test_jd_time_format(self):
         """Test time values are specified as julian dates when formatting
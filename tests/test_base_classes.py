@@ -3,8 +3,54 @@
 
 """This module tests the template classes for the user interface."""
 
+import time
+import warnings
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from astropy.table import Table
+
 from sndata.base_classes import PhotometricRelease, SpectroscopicRelease
 from sndata.exceptions import NoDownloadedData
+from sndata.utils import wrappers
+
+
+class DummyRelease(SpectroscopicRelease):
+    """A data release with generated data and no files"""
+
+    survey_abbrev = 'dummy_survey'
+    release = 'dummy_release'
+
+    def __init__(self, data_dir: str, num_ids: int = 10, delay: float = 0):
+        """Generate data for ``num_ids`` targets
+
+        Args:
+            data_dir: Existing directory to use as the data directory
+            num_ids: Number of available targets
+            delay: Seconds to wait before returning data for a target
+        """
+
+        super().__init__()
+        self._data_dir = Path(data_dir)
+        self._num_ids = num_ids
+        self._delay = delay
+
+    def _get_available_tables(self):
+        return []
+
+    def _load_table(self, table_id):
+        return Table()
+
+    def _get_available_ids(self):
+        return [f'{i:03d}' for i in range(self._num_ids)]
+
+    def _get_data_for_id(self, obj_id: str, format_table: bool = True):
+        time.sleep(self._delay)
+        return Table({'flux': [1.0]}, meta={'obj_id': obj_id})
+
+    def _download_module_data(self, force: bool = False, timeout: float = 15):
+        pass
 
 
 class SpectroscopicDataUI:
@@ -48,3 +94,53 @@ class PhotometricDataUI(SpectroscopicDataUI):
         """Test ``register_filters`` raises NoDownloadedData error"""
 
         self.assertRaises(NoDownloadedData, self.test_class.register_filters)
+
+
+class IterData(TestCase):
+    """Tests for the ``iter_data`` method"""
+
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_prefetch_preserves_order(self):
+        """Test prefetched tables are yielded in the order of available ids"""
+
+        release = DummyRelease(self.temp_dir.name)
+        obj_ids = [t.meta['obj_id'] for t in release.iter_data(max_prefetch=2)]
+        self.assertListEqual(release.get_available_ids(), obj_ids)
+
+    def test_prefetch_does_not_modify_warning_filters(self):
+        """Test prefetching data does not modify the global warning filters
+        while the consumer is also changing them
+        """
+
+        original_filters = list(warnings.filters)
+        release = DummyRelease(self.temp_dir.name, num_ids=10, delay=0.02)
+        for _ in release.iter_data(max_prefetch=2):
+            wrappers.ignore_warnings_wrapper(time.sleep)(0.01)
+            self.assertListEqual(original_filters, warnings.filters)
+
+        self.assertListEqual(original_filters, warnings.filters)
+
+    def test_parallel_preserves_order(self):
+        """Test tables loaded in parallel are yielded in the order of
+        available ids
+        """
+
+        release = DummyRelease(self.temp_dir.name)
+        obj_ids = [t.meta['obj_id'] for t in release.iter_data(max_workers=2)]
+        self.assertListEqual(release.get_available_ids(), obj_ids)
+
+    def test_parallel_stops_early(self):
+        """Test closing the iterator early cancels data that is not loaded yet"""
+
+        # Loading all data would take at least 4 seconds
+        release = DummyRelease(self.temp_dir.name, num_ids=40, delay=0.2)
+        start = time.time()
+        data_iter = release.iter_data(max_workers=2)
+        next(data_iter)
+        data_iter.close()
+        self.assertLess(time.time() - start, 2)
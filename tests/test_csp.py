@@ -3,11 +3,15 @@
 
 """Tests for the ``csp`` module."""
 
-from unittest import TestCase
+import mmap
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, mock, skipIf
 
 import numpy as np
 
 from sndata import csp
+from sndata.csp import _dr1
 from .data_parsing_template_tests import PhotometricDataParsing, SpectroscopicDataParsing
 from .standard_ui_template_tests import PhotometricDataUI, SpectroscopicDataUI
 
@@ -29,6 +33,193 @@ class DR1UI(TestCase, SpectroscopicDataUI):
         cls.test_class = csp.DR1()
 
 
+class BaseSpectrumParsing:
+    """Data free tests for parsing the contents of DR1 spectrum files"""
+
+    def assert_parsed(self, contents, expected, comments=()):
+        """Assert file contents are parsed into the expected values
+
+        Args:
+            contents (bytes): The contents of a spectrum file
+            expected (list): The expected (wavelength, flux) pairs
+            comments (list): The expected file comments
+        """
+
+        wavelength, flux, parsed_comments = _dr1._parse_spectrum(contents)
+        expected = np.array(expected, dtype=float)
+        np.testing.assert_array_equal(wavelength, expected[:, 0])
+        np.testing.assert_array_equal(flux, expected[:, 1])
+        self.assertEqual(list(comments), parsed_comments)
+
+    def test_header_comments(self):
+        """Test header comments are returned without the leading ``#``"""
+
+        contents = b'# Redshift: 0.012\n# JD: 2454506.00\n3500.5 1.25e-15\n'
+        self.assert_parsed(
+            contents, [[3500.5, 1.25e-15]], ['Redshift: 0.012', 'JD: 2454506.00'])
+
+    def test_crlf_line_endings(self):
+        """Test files with windows line endings are parsed"""
+
+        contents = b'3500.5 1.25e-15\r\n3502.5 -1.5E+02\r\n'
+        self.assert_parsed(contents, [[3500.5, 1.25e-15], [3502.5, -150]])
+
+    def test_blank_lines(self):
+        """Test empty and white space only lines are skipped"""
+
+        contents = b'\n3500.5 1.25e-15\n  \t\n\n3502.5\t+2.5e-15'
+        self.assert_parsed(contents, [[3500.5, 1.25e-15], [3502.5, 2.5e-15]])
+
+    def test_third_column_ignored(self):
+        """Test columns after the first two are ignored"""
+
+        contents = b'3500.5 1.25e-15 0.1\n3502.5 2.5e-15 0.2\n'
+        self.assert_parsed(contents, [[3500.5, 1.25e-15], [3502.5, 2.5e-15]])
+
+    def test_nan_values(self):
+        """Test ``nan`` values are parsed"""
+
+        contents = b'3500.5 1.25e-15\n3502.5 nan\n'
+        self.assert_parsed(contents, [[3500.5, 1.25e-15], [3502.5, np.nan]])
+
+    def test_long_mantissa(self):
+        """Test values with more than 15 significant digits are parsed exactly"""
+
+        contents = b'3500.5 1.2345678901234567e-15\n'
+        self.assert_parsed(contents, [[3500.5, 1.2345678901234567e-15]])
+
+    def test_large_exponents(self):
+        """Test values with large or long exponents are parsed exactly"""
+
+        contents = b'3500.5 1.25e-30\n3502.5 1.25e+300\n3504.5 1.25e-0015\n'
+        self.assert_parsed(
+            contents, [[3500.5, 1.25e-30], [3502.5, 1.25e300], [3504.5, 1.25e-15]])
+
+
+@skipIf(_dr1.njit is None, 'numba is not installed')
+class CompiledSpectrumParsing(TestCase, BaseSpectrumParsing):
+    """Tests for parsing DR1 spectra with the compiled parser"""
+
+
+class FallbackSpectrumParsing(TestCase, BaseSpectrumParsing):
+    """Tests for parsing DR1 spectra without ``numba``"""
+
+    def setUp(self):
+        patcher = mock.patch.object(_dr1, 'njit', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class DR1LocalFiles(TestCase):
+    """Data free tests for reading DR1 spectra from a local directory"""
+
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.test_class = csp.DR1()
+        self.test_class._spectra_dir = Path(self.temp_dir.name)
+
+    def write_spectrum(self, file_name, contents=b'3500.5 1.25e-15\n'):
+        """Write a spectrum file to the temporary spectra directory
+
+        Args:
+            file_name (str): Name of the file to write
+            contents (bytes): Contents of the file
+
+        Returns:
+            The path of the written file
+        """
+
+        path = self.test_class._spectra_dir / file_name
+        path.write_bytes(contents)
+        return path
+
+    @staticmethod
+    def build_spectrum(num_rows, flux='1.25e-15'):
+        """Build the contents of a spectrum file
+
+        Args:
+            num_rows (int): Number of data rows in the file
+            flux (str): The flux value written on every row
+
+        Returns:
+            The file contents as bytes
+        """
+
+        header = (
+            '# SN2004dt\n# Redshift: 0.0197\n# JD of max: 2453240.70\n'
+            '# JD of observation: 2453243.69\n# Epoch: 2.99\n')
+
+        rows = ''.join(f'{3500 + 2 * i:.1f} {flux}\n' for i in range(num_rows))
+        return (header + rows).encode()
+
+    def assert_read_spectrum(self, contents, memory_mapped):
+        """Assert a spectrum file is read with or without a memory map
+
+        Args:
+            contents (bytes): Contents of the file to read
+            memory_mapped (bool): Whether the file should be memory mapped
+
+        Returns:
+            The table read from the file
+        """
+
+        path = self.write_spectrum('SN04dt_040828_b01_DUP_WF.dat', contents)
+        with mock.patch.object(mmap, 'mmap', wraps=mmap.mmap) as mock_mmap:
+            data = _dr1.read_csp_spectroscopy_file(path)
+
+        self.assertEqual(memory_mapped, mock_mmap.called)
+        self.assertEqual(0.0197, data.meta['z'])
+        return data
+
+    def test_read_small_file(self):
+        """Test files below the memory map threshold are read"""
+
+        contents = self.build_spectrum(10)
+        self.assertLess(len(contents), _dr1._mmap_threshold)
+
+        data = self.assert_read_spectrum(contents, memory_mapped=False)
+        np.testing.assert_array_equal(3500 + 2 * np.arange(10), data['wavelength'])
+        np.testing.assert_array_equal(1.25e-15, data['flux'])
+
+    def test_read_large_file(self):
+        """Test files above the memory map threshold are read"""
+
+        contents = self.build_spectrum(1000)
+        self.assertGreater(len(contents), _dr1._mmap_threshold)
+
+        data = self.assert_read_spectrum(contents, memory_mapped=True)
+        np.testing.assert_array_equal(3500 + 2 * np.arange(1000), data['wavelength'])
+        np.testing.assert_array_equal(1.25e-15, data['flux'])
+
+    def test_read_large_file_with_fallback(self):
+        """Test memory mapped files are closed after falling back to numpy"""
+
+        contents = self.build_spectrum(1000, flux='nan')
+        self.assertGreater(len(contents), _dr1._mmap_threshold)
+
+        data = self.assert_read_spectrum(contents, memory_mapped=True)
+        self.assertEqual(1000, len(data))
+        self.assertTrue(np.isnan(data['flux']).all())
+
+    def test_missing_object_raises(self):
+        """Test a ValueError is raised for an object without spectrum files"""
+
+        with self.assertRaisesRegex(ValueError, 'No data found'):
+            self.test_class._get_data_for_id('2004xx')
+
+    def test_ids_ignore_unexpected_file_names(self):
+        """Test unexpected file names do not stop Ids from being discovered"""
+
+        self.write_spectrum('SN04dt_040826_b01_DUP_WF.dat')
+        self.write_spectrum('SN05a_050101_b01_DUP_WF.dat')
+        self.write_spectrum('SN05b.dat')
+
+        obj_ids = self.test_class._get_available_ids()
+        self.assertIn('2004dt', obj_ids)
+        self.assertIn('2005a', obj_ids)
+
+
 class DR3Parsing(TestCase, PhotometricDataParsing):
     """Data parsing tests for the DR3 release"""
 
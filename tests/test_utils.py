@@ -3,6 +3,7 @@
 
 import os
 from pathlib import Path
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 
 import numpy as np
@@ -10,7 +11,7 @@ import numpy as np
 import sndata
 from sndata import utils as utils
 from sndata.exceptions import NoDownloadedData
-from sndata.utils import unit_conversion, data_parsing
+from sndata.utils import unit_conversion, data_parsing, wrappers
 
 
 class HourangleToDegrees(TestCase):
@@ -91,6 +92,62 @@ class ConvertToJD(TestCase):
             'Incorrect date for MJD format')
 
 
+class IterFiles(TestCase):
+    """Tests for the ``iter_files`` function"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = TemporaryDirectory()
+        cls.directory = Path(cls.temp_dir.name)
+        for sub_dir in ('', 'level1', 'level1/level2'):
+            (cls.directory / sub_dir).mkdir(exist_ok=True)
+            (cls.directory / sub_dir / 'table1.dat').touch()
+            (cls.directory / sub_dir / 'ReadMe').touch()
+
+        # A directory with a matching name should never be returned
+        (cls.directory / 'level1' / 'level2' / 'table2.dat').mkdir()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
+
+    def test_matches_prefix_and_suffix(self):
+        """Test only files with the given prefix and suffix are returned"""
+
+        files = data_parsing.iter_files(self.directory, 'table', '.dat', max_depth=0)
+        expected = [str(self.directory / 'table1.dat')]
+        self.assertListEqual(expected, list(files))
+
+    def test_respects_max_depth(self):
+        """Test subdirectories are only searched up to ``max_depth``"""
+
+        files = data_parsing.iter_files(self.directory, 'table', '.dat', max_depth=1)
+        expected = [
+            str(self.directory / 'table1.dat'),
+            str(self.directory / 'level1' / 'table1.dat')
+        ]
+
+        self.assertCountEqual(expected, files)
+
+    def test_skips_matching_directories(self):
+        """Test directories with a matching name are not returned"""
+
+        files = data_parsing.iter_files(self.directory, 'table', '.dat', max_depth=2)
+        expected = [
+            str(self.directory / 'table1.dat'),
+            str(self.directory / 'level1' / 'table1.dat'),
+            str(self.directory / 'level1' / 'level2' / 'table1.dat')
+        ]
+
+        self.assertCountEqual(expected, files)
+
+    def test_missing_directory(self):
+        """Test nothing is yielded for a missing directory"""
+
+        fake_dir = Path('./This_dir_is_fake')
+        self.assertListEqual([], list(data_parsing.iter_files(fake_dir)))
+
+
 class RequireDataPath(TestCase):
     """Tests for the ``require_data_path`` function"""
 
@@ -99,3 +156,87 @@ class RequireDataPath(TestCase):
 
         fake_dir = Path('./This_dir_is_fake')
         self.assertRaises(NoDownloadedData, data_parsing.require_data_path, fake_dir)
+
+
+class LruCopyCache(TestCase):
+    """Tests for the ``lru_copy_cache`` decorator"""
+
+    def setUp(self):
+        self.num_calls = 0
+
+        @wrappers.lru_copy_cache()
+        def build_list():
+            self.num_calls += 1
+            return [1, 2, 3]
+
+        self.build_list = build_list
+
+    def test_returns_copy(self):
+        """Test mutating a returned value does not mutate the cache"""
+
+        self.build_list().append(4)
+        self.assertListEqual([1, 2, 3], self.build_list())
+        self.assertEqual(1, self.num_calls)
+
+    def test_cache_clear(self):
+        """Test ``cache_clear`` forces the wrapped function to be re-evaluated"""
+
+        self.build_list()
+        self.build_list.cache_clear()
+        self.build_list()
+        self.assertEqual(2, self.num_calls)
+
+
+class DirMtimeCache(TestCase):
+    """Tests for the ``dir_mtime_cache`` decorator"""
+
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.directory = Path(self.temp_dir.name)
+        self.num_calls = 0
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    @wrappers.dir_mtime_cache('directory')
+    def list_files(self):
+        self.num_calls += 1
+        return sorted(f.name for f in self.directory.glob('*'))
+
+    def test_cached_until_modified(self):
+        """Test the cache is only invalidated when the directory is modified"""
+
+        self.assertListEqual([], self.list_files())
+        self.list_files()
+        self.assertEqual(1, self.num_calls)
+
+        # Force a new modification time for file systems with coarse resolution
+        (self.directory / 'new_file').touch()
+        os.utime(self.directory, ns=(0, 0))
+        self.assertListEqual(['new_file'], self.list_files())
+        self.assertEqual(2, self.num_calls)
+
+    def test_missing_directory_not_cached(self):
+        """Test return values are not cached for missing directories"""
+
+        self.directory = self.directory / 'fake_dir'
+        self.list_files()
+        self.list_files()
+        self.assertEqual(2, self.num_calls)
+
+
+class PrefetchMap(TestCase):
+    """Tests for the ``prefetch_map`` function"""
+
+    def test_preserves_order(self):
+        """Test returned values match the order of the input iterable"""
+
+        for max_prefetch in (0, 1, 3):
+            returned = list(wrappers.prefetch_map(str, range(10), max_prefetch))
+            self.assertListEqual([str(i) for i in range(10)], returned)
+
+    def test_exceptions_propagate(self):
+        """Test errors raised by the mapped function reach the consumer"""
+
+        with self.assertRaises(ZeroDivisionError):
+            list(wrappers.prefetch_map(lambda x: 1 / x, [1, 0, 2]))